@@ -18,13 +18,78 @@ import re
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, NamedTuple
 
 BASE_DIR = Path(__file__).parent.parent
 SCHEDULES_DIR = BASE_DIR / "schedules"
 
-
-def parse_schedule_text(text_content: str, start_date: str, community_slug: str) -> List[Dict]:
+# Buffer size for schedule file I/O (1 MiB keeps syscalls rare on large files)
+IO_BUFFER_SIZE = 1 << 20
+
+# Line patterns, compiled once at import time.
+# _LINE_RE classifies a stripped line in a single match; its alternatives are
+# tried in order and the outer group that matched is reported by lastgroup:
+# - day:    day header, e.g. "Day 1: Neighborhood Reflections..."
+# - header: table header (ID, Bot & Time, Comment)
+# - tab:    content row "ID<tab>Account<tab>Content" or "ID.<tab>Account<tab>Content"
+#           (Researchers: "0<tab>Researchers<tab>content", bots: "1.", "1.1", ...)
+# - space:  alternative content row format with spaces as separators
+_LINE_RE = re.compile(
+    r'^(?:'
+    r'(?P<day>(?i:Day)\s+(?P<day_num>\d+):\s*(?P<day_title>.+))'
+    r'|(?P<header>ID.*Bot.*)'
+    r'|(?P<tab>(?P<tab_id>\d+(?:\.\d+)*)?\.?\t(?P<tab_account>.+?)\t(?P<tab_body>.*))'
+    r'|(?P<space>(?P<space_id>\d+(?:\.\d+)*)\.?\s+(?P<space_account>.+?)\s{2,}(?P<space_body>.*))'
+    r')$'
+)
+# Raw lines that end a multi-line body: a new row, a day header or a table header
+_BOUNDARY_RE = re.compile(r'\d+(?:\.\d+)*\.?\t|(?i:Day)\s+\d+:|ID\t')
+_LLM_RE = re.compile(r'/LLM generated sentence/')
+
+# (row id, account, content) group names for each row alternative of _LINE_RE
+_ROW_GROUPS = {
+    "tab": ("tab_id", "tab_account", "tab_body"),
+    "space": ("space_id", "space_account", "space_body"),
+}
+
+# Posts are spread through the day from 10:00 AM, 5 minutes apart
+BASE_HOUR = 10
+MINUTES_BETWEEN_POSTS = 5
+
+
+def _format_slot_time(slot: int) -> str:
+    """Format the HH:MM time of the nth post of a day."""
+    minute_offset = slot * MINUTES_BETWEEN_POSTS
+    return f"{BASE_HOUR + minute_offset // 60:02d}:{minute_offset % 60:02d}"
+
+
+# Pre-formatted times for the first 300 posts of a day
+_TIME_STRINGS = tuple(_format_slot_time(slot) for slot in range(300))
+
+
+class ScheduleRow(NamedTuple):
+    """A single output CSV row, with fields in column order"""
+    datetime: str
+    time: str
+    account: str
+    title: str
+    body: str
+    kind: str
+    reply_to: str
+    community: str
+
+
+# Output CSV header, in the same order as the ScheduleRow fields
+CSV_COLUMNS = ScheduleRow._fields
+
+
+# Line tags assigned by the classification pass in parse_schedule_text
+# (_CONT: continuation of the preceding row's body, _OTHER: stray text)
+_BLANK, _DAY, _HEADER, _ROW, _CONT, _OTHER = range(6)
+_LINE_TAGS = {"day": _DAY, "header": _HEADER, "tab": _ROW, "space": _ROW}
+
+
+def parse_schedule_text(text_content: str, start_date: str, community_slug: str) -> Iterator[ScheduleRow]:
     """
     Parse the schedule text file and convert to CSV rows.
 
@@ -33,142 +98,143 @@ def parse_schedule_text(text_content: str, start_date: str, community_slug: str)
         start_date: Start date in YYYY-MM-DD format
         community_slug: Target community slug
 
-    Returns:
-        List of dicts representing CSV rows
+    Yields:
+        ScheduleRow tuples representing CSV rows, in schedule order
     """
-    rows = []
-    lines = text_content.strip().split('\n')
+    # Split on "\n" only: splitlines() would also break on form feeds, vertical
+    # tabs and Unicode separators, and two in a row would end a body early
+    lines = text_content.split('\n')
+    line_count = len(lines)
+
+    # Classify every line exactly once up front.
+    # Lines following a row belong to its body until a boundary (a new row,
+    # a day header, a table header or a blank line); they only need the
+    # cheap boundary check and are never matched against _LINE_RE.
+    tags = [_OTHER] * line_count
+    matches = [None] * line_count
+    # Bound locally to skip global and attribute lookups in the hot loops
+    match_line = _LINE_RE.match
+    match_boundary = _BOUNDARY_RE.match
+    strip_placeholders = _LLM_RE.sub
+    time_strings = _TIME_STRINGS
+    in_body = False
+    for idx, raw_line in enumerate(lines):
+        line = raw_line.strip()
+        if not line:
+            tags[idx] = _BLANK
+            in_body = False
+            continue
+
+        if in_body and not match_boundary(raw_line):
+            tags[idx] = _CONT
+            continue
+
+        match = match_line(line)
+        if match:
+            tags[idx] = _LINE_TAGS[match.lastgroup]
+            matches[idx] = match
+        in_body = tags[idx] == _ROW
 
     current_day = 0
-    current_date = datetime.strptime(start_date, "%Y-%m-%d")
+    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    date_str = start_dt.strftime("%Y-%m-%d")
     current_title = ""
-    base_time = 10  # Starting hour (10:00 AM)
-    minute_offset = 0
+    slot = 0  # Index of the next post within the current day
 
     i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Skip empty lines
-        if not line:
+    while i < line_count:
+        tag = tags[i]
+
+        if tag == _DAY:
+            day_match = matches[i]
+            current_day = int(day_match.group("day_num"))
+            current_title = day_match.group("day_title").strip()
+            date_str = (start_dt + timedelta(days=current_day - 1)).strftime("%Y-%m-%d")
+            slot = 0
             i += 1
             continue
 
-        # Check for day header (e.g., "Day 1: Neighborhood Reflections...")
-        day_match = re.match(r'^Day\s+(\d+):\s*(.+)$', line, re.IGNORECASE)
-        if day_match:
-            current_day = int(day_match.group(1))
-            current_title = day_match.group(2).strip()
-            current_date = datetime.strptime(start_date, "%Y-%m-%d") + timedelta(days=current_day - 1)
-            minute_offset = 0
+        # Skip empty lines, table headers and stray text outside of a row
+        if tag != _ROW:
             i += 1
             continue
 
-        # Skip table headers (ID, Bot & Time, Comment)
-        if line.startswith("ID") and "Bot" in line:
-            i += 1
+        row_match = matches[i]
+        row_id, account, content = row_match.group(*_ROW_GROUPS[row_match.lastgroup])
+        row_id = row_id or "0"
+        # Schedules reuse a handful of account names across many rows
+        account = sys.intern(account.strip())
+
+        # Handle multi-line content (content may span multiple lines)
+        content_parts = [content.strip()]
+        j = i + 1
+        while j < line_count and tags[j] == _CONT:
+            content_parts.append(lines[j].strip())
+            j += 1
+        # Joining the already-stripped, non-empty parts leaves no surrounding
+        # whitespace, so the body needs no further strip before cleanup
+        content = " ".join(part for part in content_parts if part)
+        i = j
+
+        # Calculate time (spread posts throughout the day)
+        time_str = time_strings[slot] if slot < len(time_strings) else _format_slot_time(slot)
+        slot += 1
+
+        # Remove LLM placeholders
+        content = strip_placeholders('', content).strip()
+
+        # Row "0" is the Researchers' thread-creating post, carrying the day's title
+        if row_id == "0":
+            yield ScheduleRow(
+                datetime=date_str,
+                time=time_str,
+                account=account,
+                title=current_title,
+                body=content,
+                kind="self",
+                reply_to="",
+                community=community_slug
+            )
+            continue
+
+        # Skip empty comments
+        if not content:
             continue
 
-        # Parse content rows
-        # Format: ID<tab>Account<tab>Content  OR  ID.<tab>Account<tab>Content
-        # For Researchers (ID=0): 0<tab>Researchers<tab>content
-        # For bots: 1.<tab>BotName<tab>content  or  1.1<tab>BotName<tab>content
-
-        # Match patterns like: "0", "1.", "1.1", "1.1.1", etc.
-        row_match = re.match(r'^(\d+(?:\.\d+)*)?\.?\t(.+?)\t(.*)$', line)
-        if not row_match:
-            # Try alternative format with spaces or different separators
-            row_match = re.match(r'^(\d+(?:\.\d+)*)\.?\s+(.+?)\s{2,}(.*)$', line)
-
-        if row_match:
-            row_id = row_match.group(1) or "0"
-            account = row_match.group(2).strip()
-            content = row_match.group(3).strip()
-
-            # Handle multi-line content (content may span multiple lines)
-            j = i + 1
-            while j < len(lines):
-                next_line = lines[j]
-                # Check if next line is a new row (starts with number or is a day header)
-                if re.match(r'^\d+(?:\.\d+)*\.?\t', next_line) or \
-                   re.match(r'^Day\s+\d+:', next_line, re.IGNORECASE) or \
-                   re.match(r'^ID\t', next_line) or \
-                   not next_line.strip():
-                    break
-                content += " " + next_line.strip()
-                j += 1
-            i = j - 1
-
-            # Calculate time (spread posts throughout the day)
-            hour = base_time + (minute_offset // 60)
-            minute = minute_offset % 60
-            time_str = f"{hour:02d}:{minute:02d}"
-            minute_offset += 5  # 5 minutes between posts
-
-            # Determine kind and reply_to
-            if row_id == "0":
-                kind = "self"
-                reply_to = ""
-            else:
-                kind = "comment"
-                # reply_to is the parent ID
-                # "1" replies to thread (parent is "0")
-                # "1.1" replies to "1"
-                # "1.1.1" replies to "1.1"
-                parts = row_id.split(".")
-                if len(parts) == 1:
-                    # Top-level comment, reply to "0" (the thread)
-                    reply_to = "0"
-                else:
-                    # Nested reply, reply to parent
-                    reply_to = ".".join(parts[:-1])
-
-            # Clean up content
-            content = content.strip()
-            # Remove LLM placeholders
-            content = re.sub(r'/LLM generated sentence/', '', content)
-            content = content.strip()
-
-            # Skip empty content
-            if not content and kind != "self":
-                i += 1
-                continue
-
-            rows.append({
-                "datetime": current_date.strftime("%Y-%m-%d"),
-                "time": time_str,
-                "account": account,
-                "title": current_title if kind == "self" else "",
-                "body": content,
-                "kind": kind,
-                "reply_to": reply_to,
-                "community": community_slug,
-                "row_id": row_id  # Keep track for reference mapping
-            })
-
-        i += 1
-
-    return rows
+        # reply_to is the parent ID
+        # "1" replies to thread (parent is "0")
+        # "1.1" replies to "1"
+        # "1.1.1" replies to "1.1"
+        parent_id, sep, _ = row_id.rpartition(".")
+        yield ScheduleRow(
+            datetime=date_str,
+            time=time_str,
+            account=account,
+            title="",
+            body=content,
+            kind="comment",
+            # Nested replies point at their parent, top-level comments at "0" (the thread)
+            reply_to=parent_id if sep else "0",
+            community=community_slug
+        )
 
 
 def convert_file(input_path: Path, output_path: Path, start_date: str, community_slug: str):
     """Convert a text schedule file to CSV format."""
-    with open(input_path, "r", encoding="utf-8") as f:
+    with open(input_path, "r", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
         text_content = f.read()
 
-    rows = parse_schedule_text(text_content, start_date, community_slug)
-
-    # Remove row_id from output (it was just for debugging)
-    for row in rows:
-        del row["row_id"]
-
-    with open(output_path, "w", encoding="utf-8", newline="") as f:
-        fieldnames = ["datetime", "time", "account", "title", "body", "kind", "reply_to", "community"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    print(f"Converted {len(rows)} rows to {output_path}")
+    # Stream rows straight from the parser to disk
+    row_count = 0
+    with open(output_path, "w", encoding="utf-8", newline="", buffering=IO_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        writerow = writer.writerow
+        for row in parse_schedule_text(text_content, start_date, community_slug):
+            writerow(row)
+            row_count += 1
+
+    print(f"Converted {row_count} rows to {output_path}")
 
 
 def main():
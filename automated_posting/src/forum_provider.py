@@ -6,13 +6,25 @@ It handles authentication, community/bot creation, and posting operations.
 """
 
 import requests
-import json
 import logging
-from typing import Dict, List, Optional, Any
+import os
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .utils import jsonio
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared session
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Write buffer size for state files
+STATE_BUFFER_SIZE = 1 << 20
+
 
 @dataclass
 class BotAccount:
@@ -84,7 +96,27 @@ class ForumProvider:
         self.admin_password = admin_password
         self.admin_token: Optional[str] = None
         self.bot_tokens: Dict[str, str] = {}  # bot_id -> access_token
+        self._bot_headers: Dict[str, Dict[str, str]] = {}  # bot_id -> auth headers
         self.session = requests.Session()
+        self.session.headers["Content-Type"] = "application/json"
+        self.session.headers["Connection"] = "keep-alive"
+
+        # Keep connections to the API alive and retry transient failures.
+        # POSTs are only retried when the request never reached the server;
+        # once retries run out the last response is returned as-is so that
+        # error statuses still surface as APIError.
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _make_request(
         self,
@@ -92,16 +124,22 @@ class ForumProvider:
         endpoint: str,
         token: Optional[str] = None,
         data: Optional[Dict] = None,
-        params: Optional[Dict] = None
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
     ) -> Dict:
-        """Make an API request"""
+        """
+        Make an API request.
+
+        Pre-built headers (e.g. a bot's cached Authorization header) take
+        precedence over token; otherwise the admin token is used if set.
+        """
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
-        headers = {"Content-Type": "application/json"}
 
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        elif self.admin_token:
-            headers["Authorization"] = f"Bearer {self.admin_token}"
+        if headers is None:
+            if token:
+                headers = {"Authorization": f"Bearer {token}"}
+            elif self.admin_token:
+                headers = {"Authorization": f"Bearer {self.admin_token}"}
 
         try:
             response = self.session.request(
@@ -113,10 +151,12 @@ class ForumProvider:
                 timeout=30
             )
 
+            body = response.content
+
             if response.status_code >= 400:
                 try:
-                    error_body = response.json()
-                except:
+                    error_body = jsonio.loads(body)
+                except ValueError:
                     error_body = response.text
                 raise APIError(
                     f"API request failed: {response.status_code}",
@@ -124,13 +164,16 @@ class ForumProvider:
                     error_body
                 )
 
-            if response.status_code == 204:
+            # 204 No Content and other empty bodies
+            if not body:
                 return {}
 
-            return response.json()
+            return jsonio.loads(body)
 
         except requests.RequestException as e:
             raise ForumProviderError(f"Request failed: {e}")
+        except ValueError as e:
+            raise ForumProviderError(f"Invalid JSON response: {e}")
 
     def login(self) -> None:
         """
@@ -276,6 +319,17 @@ class ForumProvider:
         Used when tokens are provided externally.
         """
         self.bot_tokens[bot_id] = token
+        self._bot_headers[bot_id] = {"Authorization": f"Bearer {token}"}
+
+    def _get_bot_headers(self, bot_id: str) -> Dict[str, str]:
+        """Get the cached Authorization header for a bot"""
+        headers = self._bot_headers.get(bot_id)
+        if headers is None:
+            token = self.bot_tokens.get(bot_id)
+            if not token:
+                raise ForumProviderError(f"No token found for bot {bot_id}")
+            headers = self._bot_headers[bot_id] = {"Authorization": f"Bearer {token}"}
+        return headers
 
     def submit_thread(
         self,
@@ -296,14 +350,12 @@ class ForumProvider:
         Returns:
             Dict with threadId, postId, etc.
         """
-        token = self.bot_tokens.get(bot_id)
-        if not token:
-            raise ForumProviderError(f"No token found for bot {bot_id}")
+        headers = self._get_bot_headers(bot_id)
 
         return self._make_request(
             "POST",
             "/bot/threads",
-            token=token,
+            headers=headers,
             data={
                 "subcommunitySlug": subcommunity_slug,
                 "title": title,
@@ -330,9 +382,7 @@ class ForumProvider:
         Returns:
             Dict with postId, etc.
         """
-        token = self.bot_tokens.get(bot_id)
-        if not token:
-            raise ForumProviderError(f"No token found for bot {bot_id}")
+        headers = self._get_bot_headers(bot_id)
 
         data = {
             "threadId": thread_id,
@@ -344,29 +394,72 @@ class ForumProvider:
         return self._make_request(
             "POST",
             "/bot/posts",
-            token=token,
+            headers=headers,
             data=data
         )
 
+    def submit_replies_bulk(
+        self,
+        items: List[Tuple[str, str, str, Optional[str]]],
+        max_workers: int = 16
+    ) -> List[Dict]:
+        """
+        Create several replies concurrently.
+
+        Requests are issued from a thread pool sharing this provider's
+        session, so network round trips overlap instead of running back
+        to back. Replies are independent of each other: a reply whose
+        parent is created in the same batch must be submitted separately.
+
+        Args:
+            items: (bot_id, thread_id, content, parent_post_id) tuples,
+                   as accepted by submit_reply
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            List of response dicts, in the same order as items.
+            The first failed reply's exception is re-raised.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.submit_reply, *item) for item in items]
+            return [future.result() for future in futures]
+
     def get_bot_stats(self, bot_id: str) -> Dict:
         """
         Get posting statistics for a bot.
         """
-        token = self.bot_tokens.get(bot_id)
-        if not token:
-            raise ForumProviderError(f"No token found for bot {bot_id}")
+        headers = self._get_bot_headers(bot_id)
 
-        return self._make_request("GET", "/bot/stats", token=token)
+        return self._make_request("GET", "/bot/stats", headers=headers)
 
-    def save_state(self, filepath: str, state: Dict) -> None:
-        """Save state to a JSON file"""
-        with open(filepath, "w") as f:
-            json.dump(state, f, indent=2)
+    def save_state(
+        self,
+        filepath: str,
+        state: Dict,
+        pretty: bool = False,
+        durable: bool = False
+    ) -> None:
+        """
+        Save state to a JSON file.
+
+        Output is compact by default; pass pretty=True for indented,
+        human-readable output (slower to write).
+
+        By default the write is left to the OS page cache, which is fast
+        but may be lost on a crash. Pass durable=True to fsync the file
+        before returning; callers checkpointing often can batch several
+        updates between durable saves.
+        """
+        with open(filepath, "wb", buffering=STATE_BUFFER_SIZE) as f:
+            f.write(jsonio.dumps(state, pretty=pretty))
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
 
     def load_state(self, filepath: str) -> Dict:
         """Load state from a JSON file"""
         try:
-            with open(filepath, "r") as f:
-                return json.load(f)
+            with open(filepath, "rb") as f:
+                return jsonio.loads(f.read())
         except FileNotFoundError:
             return {}
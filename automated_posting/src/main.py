@@ -5,25 +5,38 @@ Forum Bot Automation - Main Entry Point
 Usage:
     python -m src.main --init-forum       # Initialize communities and bots
     python -m src.main run-once           # Run scheduled posts for today
-    python -m src.main watch              # Watch mode: check every minute, post when due
+    python -m src.main watch              # Watch mode: post when due, picking up schedule edits within a minute
     python -m src.main --status           # Show current status
 """
 
 import argparse
+import atexit
+import bisect
 import csv
-import json
 import logging
 import os
+import queue
 import random
 import sys
-from datetime import datetime, date
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 import time
 
 import yaml
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 from .forum_provider import ForumProvider, BotAccount, Community, ForumProviderError
+from .utils import jsonio
 
 # Setup logging
 logging.basicConfig(
@@ -39,37 +52,218 @@ STATE_DIR = BASE_DIR / "state"
 SCHEDULES_DIR = BASE_DIR / "schedules"
 
 
+class ScheduleEntry(NamedTuple):
+    """A single schedule CSV row, with fields stripped of whitespace"""
+    datetime: str = ""
+    time: str = ""
+    account: str = ""
+    title: str = ""
+    body: str = ""
+    kind: str = "self"
+    reply_to: str = ""
+    community: str = ""
+
+
+@dataclass
+class Schedule:
+    """Parsed schedule rows plus lookups derived from them"""
+    mtime_ns: int
+    rows: List[ScheduleEntry]
+    # Slot start (row date and time parsed to the minute) -> [(row index, row)],
+    # in file order. Rows whose date or time doesn't parse are left out.
+    by_slot: Dict[datetime, List[Tuple[int, ScheduleEntry]]]
+    # Every slot start in by_slot, sorted
+    slot_times: List[datetime]
+
+
+# Parsed schedules, keyed by path
+_schedule_cache: Dict[Path, Schedule] = {}
+
+# Parsed config files, keyed by path: (mtime_ns, config)
+_config_cache: Dict[Path, Tuple[int, Dict]] = {}
+
+# Long-lived append handle for posted_log.jsonl (see _get_post_log)
+_post_log = None
+
+# Watch-mode executed post keys older than this many days are forgotten
+EXECUTED_RETENTION_DAYS = 7
+
+# Long-lived append handle for executed_posts.txt (see mark_executed)
+_executed_log = None
+
+# Maximum number of communities init_forum sets up concurrently
+INIT_MAX_WORKERS = 4
+
+
 def load_config(config_name: str) -> Dict:
-    """Load a YAML config file"""
+    """
+    Load a YAML config file.
+
+    The parsed config is cached until the file's modification time changes.
+    The returned config is shared with the cache and must not be modified.
+    """
     config_path = CONFIG_DIR / f"{config_name}.yaml"
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    cached = _config_cache.get(config_path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
 
     with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+        config = yaml.load(f, Loader=YamlLoader)
+    _config_cache[config_path] = (mtime_ns, config)
+    return config
 
 
 def load_state() -> Dict:
     """Load the forum state"""
     state_path = STATE_DIR / "forum_setup.json"
     if state_path.exists():
-        with open(state_path, "r") as f:
-            return json.load(f)
+        with open(state_path, "rb") as f:
+            return jsonio.loads(f.read())
     return {}
 
 
 def save_state(state: Dict) -> None:
-    """Save the forum state"""
+    """
+    Save the forum state.
+
+    Written compactly to a temporary file that then replaces the state file,
+    so a crash mid-write never leaves a truncated forum_setup.json behind.
+    """
     state_path = STATE_DIR / "forum_setup.json"
-    with open(state_path, "w") as f:
-        json.dump(state, f, indent=2)
+    tmp_path = state_path.with_suffix(".json.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(jsonio.dumps(state))
+    os.replace(tmp_path, state_path)
+
+
+def _get_post_log():
+    """Get the shared append handle for the post log, opening it on first use"""
+    global _post_log
+    if _post_log is None:
+        _post_log = open(STATE_DIR / "posted_log.jsonl", "ab", buffering=1 << 16)
+        atexit.register(_post_log.close)
+    return _post_log
 
 
 def log_post(post_data: Dict) -> None:
-    """Append a posted entry to the log"""
-    log_path = STATE_DIR / "posted_log.jsonl"
-    with open(log_path, "a") as f:
-        f.write(json.dumps(post_data) + "\n")
+    """
+    Append a posted entry to the log.
+
+    Entries are buffered; call flush_post_log() once per batch of posts.
+    """
+    _get_post_log().write(jsonio.dumps(post_data) + b"\n")
+
+
+def flush_post_log() -> None:
+    """Flush buffered post log entries to disk"""
+    if _post_log is not None:
+        _post_log.flush()
+
+
+def _is_recent_post_key(post_key: str, cutoff: str) -> bool:
+    """Check if an executed post key ("<row>:<date>:<time>") is dated on or after cutoff"""
+    return post_key.partition(":")[2][:10] >= cutoff
+
+
+def load_executed_posts() -> Set[str]:
+    """
+    Load the keys of posts already executed in watch mode.
+
+    Entries older than EXECUTED_RETENTION_DAYS are dropped, and the file is
+    compacted if anything was pruned.
+    """
+    executed_path = STATE_DIR / "executed_posts.txt"
+    if not executed_path.exists():
+        return set()
+
+    with open(executed_path, "r") as f:
+        post_keys = {line.strip() for line in f if line.strip()}
+
+    cutoff = (date.today() - timedelta(days=EXECUTED_RETENTION_DAYS)).isoformat()
+    recent = {key for key in post_keys if _is_recent_post_key(key, cutoff)}
+    if len(recent) != len(post_keys):
+        with open(executed_path, "w") as f:
+            f.writelines(f"{key}\n" for key in sorted(recent))
+    return recent
+
+
+def prune_executed_posts(executed_posts: Set[str]) -> None:
+    """Drop in-memory executed post keys older than EXECUTED_RETENTION_DAYS"""
+    cutoff = (date.today() - timedelta(days=EXECUTED_RETENTION_DAYS)).isoformat()
+    stale = [key for key in executed_posts if not _is_recent_post_key(key, cutoff)]
+    executed_posts.difference_update(stale)
+
+
+def mark_executed(post_keys: List[str]) -> None:
+    """Append executed post keys to executed_posts.txt so restarts skip them"""
+    global _executed_log
+    if _executed_log is None:
+        _executed_log = open(STATE_DIR / "executed_posts.txt", "a", buffering=1 << 16)
+        atexit.register(_executed_log.close)
+    _executed_log.writelines(f"{key}\n" for key in post_keys)
+    _executed_log.flush()
+
+
+def get_default_community_slug(state: Dict) -> Optional[str]:
+    """Get the slug of the first community, used for rows without a community"""
+    communities = state.get("communities", {})
+    if communities:
+        first_community = next(iter(communities.values()))
+        return first_community.get("slug")
+    return None
+
+
+def _collect_results(jobs: List[Tuple[Any, Future]]) -> Tuple[List[Tuple[Any, Any]], Optional[Exception]]:
+    """
+    Wait for every (key, future) pair.
+
+    Returns:
+        (key, result) pairs for the futures that succeeded, in order, and the
+        first failure (or None)
+    """
+    results = []
+    error = None
+    for key, future in jobs:
+        try:
+            results.append((key, future.result()))
+        except Exception as e:
+            if error is None:
+                error = e
+    return results, error
+
+
+def _create_community(provider: ForumProvider, comm_config: Dict) -> Community:
+    """Create a community as described by a communities config entry"""
+    name_style = comm_config.get("name_style", "nature")
+    comm_type = comm_config.get("type", "INVITE_ONLY")
+    description = comm_config.get("description")
+
+    logger.info(f"Creating community with style={name_style}, type={comm_type}")
+    community = provider.create_community(
+        community_type=comm_type,
+        description=description,
+        name_style=name_style
+    )
+    logger.info(f"Created community: {community.name} ({community.slug})")
+    return community
+
+
+def _create_community_bots(provider: ForumProvider, comm_config: Dict, community: Community) -> List[BotAccount]:
+    """Create the bots for a community as described by its config entry"""
+    bot_count = comm_config.get("bot_count", 10)
+    avatar_rules = comm_config.get("avatar_rules")
+
+    logger.info(f"Creating {bot_count} bots for {community.name}...")
+    return provider.create_bots(
+        count=bot_count,
+        subcommunity_id=community.id,
+        avatar_rules=avatar_rules
+    )
 
 
 def init_forum(provider: ForumProvider, config: Dict) -> None:
@@ -91,6 +285,7 @@ def init_forum(provider: ForumProvider, config: Dict) -> None:
 
     communities_config = config.get("communities", [])
 
+    pending = []
     for i, comm_config in enumerate(communities_config):
         if not comm_config.get("active", True):
             continue
@@ -99,61 +294,66 @@ def init_forum(provider: ForumProvider, config: Dict) -> None:
         if comm_key in state["communities"]:
             logger.info(f"Community {comm_key} already exists, skipping...")
             continue
-
-        # Create community
-        name_style = comm_config.get("name_style", "nature")
-        comm_type = comm_config.get("type", "INVITE_ONLY")
-        description = comm_config.get("description")
-
-        logger.info(f"Creating community with style={name_style}, type={comm_type}")
-        community = provider.create_community(
-            community_type=comm_type,
-            description=description,
-            name_style=name_style
-        )
-        logger.info(f"Created community: {community.name} ({community.slug})")
-
-        state["communities"][comm_key] = {
-            "id": community.id,
-            "name": community.name,
-            "slug": community.slug,
-            "invite_code": community.invite_code,
-            "password": community.password
-        }
-        save_state(state)
-
-        # Create bots for this community
-        bot_count = comm_config.get("bot_count", 10)
-        avatar_rules = comm_config.get("avatar_rules")
-
-        logger.info(f"Creating {bot_count} bots for {community.name}...")
-        bots = provider.create_bots(
-            count=bot_count,
-            subcommunity_id=community.id,
-            avatar_rules=avatar_rules
-        )
-
-        # Initialize bot_tokens if not present
-        if "bot_tokens" not in state:
-            state["bot_tokens"] = {}
-
-        for j, bot in enumerate(bots):
-            bot_key = f"{comm_key}_bot_{j}"
-            state["bots"][bot_key] = {
-                "id": bot.id,
-                "display_name": bot.display_name,
-                "email": bot.email,
-                "community_id": community.id,
-                "community_slug": community.slug
-            }
-            # Map persona names to bot IDs (for schedule CSV)
-            state["account_mapping"][bot.display_name] = bot.id
-            # Store bot tokens for posting
-            if bot.access_token:
-                state["bot_tokens"][bot.id] = bot.access_token
-
+        pending.append((comm_key, comm_config))
+
+    # Communities are independent, so their API calls run concurrently.
+    # Results are recorded in config order on this thread. Bots are created
+    # for every community that was created, even if another community
+    # failed, before the first error is re-raised; a re-run skips existing
+    # communities, so one left without bots would stay that way. The state
+    # is written once at the end; the finally block still records whatever
+    # was created if an API call fails part-way through.
+    try:
+        with ThreadPoolExecutor(max_workers=INIT_MAX_WORKERS) as executor:
+            community_jobs = [
+                ((comm_key, comm_config), executor.submit(_create_community, provider, comm_config))
+                for comm_key, comm_config in pending
+            ]
+            community_results, community_error = _collect_results(community_jobs)
+            created = []
+            for (comm_key, comm_config), community in community_results:
+                state["communities"][comm_key] = {
+                    "id": community.id,
+                    "name": community.name,
+                    "slug": community.slug,
+                    "invite_code": community.invite_code,
+                    "password": community.password
+                }
+                created.append((comm_key, comm_config, community))
+
+            # Create bots for the new communities
+            bot_jobs = [
+                ((comm_key, community), executor.submit(_create_community_bots, provider, comm_config, community))
+                for comm_key, comm_config, community in created
+            ]
+            bot_results, bot_error = _collect_results(bot_jobs)
+            for (comm_key, community), bots in bot_results:
+                # Initialize bot_tokens if not present
+                if "bot_tokens" not in state:
+                    state["bot_tokens"] = {}
+
+                for j, bot in enumerate(bots):
+                    bot_key = f"{comm_key}_bot_{j}"
+                    state["bots"][bot_key] = {
+                        "id": bot.id,
+                        "display_name": bot.display_name,
+                        "email": bot.email,
+                        "community_id": community.id,
+                        "community_slug": community.slug
+                    }
+                    # Map persona names to bot IDs (for schedule CSV)
+                    state["account_mapping"][bot.display_name] = bot.id
+                    # Store bot tokens for posting
+                    if bot.access_token:
+                        state["bot_tokens"][bot.id] = bot.access_token
+
+                logger.info(f"Created {len(bots)} bots for {community.name}")
+
+        error = community_error or bot_error
+        if error is not None:
+            raise error
+    finally:
         save_state(state)
-        logger.info(f"Created {len(bots)} bots")
 
     logger.info("Forum initialization complete!")
     logger.info(f"State saved to {STATE_DIR / 'forum_setup.json'}")
@@ -197,172 +397,500 @@ def run_schedule(provider: ForumProvider, config: Dict, schedule_file: str) -> N
     # Key format: "0" for thread, "1", "2" for top-level replies, "1.1" for nested replies
     post_refs: Dict[str, Dict[str, str]] = {}  # reference -> {"thread_id": ..., "post_id": ...}
 
-    with open(schedule_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-
-        for row in reader:
-            # Filter by today's date
-            if row.get("datetime") != today:
-                continue
-
-            account_name = row.get("account", "").strip()
-            title = row.get("title", "").strip()
-            body = row.get("body", "").strip()
-            kind = row.get("kind", "self").strip()
-            reply_to = row.get("reply_to", "").strip()
-            community_slug = row.get("community", "").strip()
-
-            # Skip empty body
-            if not body:
-                logger.warning(f"Empty body for {account_name}, skipping...")
-                continue
-
-            # Get community slug from first community if not specified
-            if not community_slug:
-                communities = state.get("communities", {})
-                if communities:
-                    first_community = list(communities.values())[0]
-                    community_slug = first_community.get("slug")
+    default_slug = get_default_community_slug(state)
+    # Looked up once; the loop below only reads them
+    account_mapping = state.get("account_mapping", {})
+    bot_tokens = state.get("bot_tokens", {})
+
+    # Bulk-read the schedule once, then keep only today's rows
+    rows = [row for row in load_schedule_rows(schedule_file) if row.datetime == today]
+
+    for row in rows:
+        account_name = row.account
+        title = row.title
+        body = row.body
+        kind = row.kind
+        reply_to = row.reply_to
+        community_slug = row.community
+
+        # Skip empty body
+        if not body:
+            logger.warning(f"Empty body for {account_name}, skipping...")
+            continue
 
-            try:
-                if kind == "self":
-                    # Only Researchers can create threads
-                    if account_name.lower() != "researchers":
-                        logger.warning(f"Only Researchers can create threads, skipping {account_name}")
-                        continue
+        # Use the first community if not specified
+        if not community_slug:
+            community_slug = default_slug
+
+        try:
+            if kind == "self":
+                # Only Researchers can create threads
+                if account_name.lower() != "researchers":
+                    logger.warning(f"Only Researchers can create threads, skipping {account_name}")
+                    continue
+
+                # Use admin token for Researchers
+                result = provider._make_request(
+                    "POST",
+                    f"/c/{community_slug}/threads",
+                    data={
+                        "title": title,
+                        "content": body
+                    }
+                )
+                thread_id = result["id"]
+                # Get the first post ID (the OP)
+                posts_result = provider._make_request(
+                    "GET",
+                    f"/t/{thread_id}/posts"
+                )
+                post_id = posts_result[0]["id"] if posts_result else None
+
+                logger.info(f"Created thread: {title[:50]}... by {account_name}")
+
+                # Store reference for "0" (the thread/OP)
+                post_refs["0"] = {"thread_id": thread_id, "post_id": post_id}
+
+                log_post({
+                    "timestamp": datetime.now().isoformat(),
+                    "type": "thread",
+                    "account": account_name,
+                    "thread_id": thread_id,
+                    "post_id": post_id,
+                    "ref": "0"
+                })
+
+            elif kind == "comment":
+                # Map account name to bot ID
+                bot_id = account_mapping.get(account_name)
+                if not bot_id:
+                    logger.warning(f"Unknown account: {account_name}, skipping...")
+                    continue
+
+                # Get bot token
+                bot_token = bot_tokens.get(bot_id)
+                if not bot_token:
+                    logger.warning(f"No token for bot {account_name}, skipping...")
+                    continue
+
+                # Only (re)register the token when the provider doesn't hold it yet
+                if provider.bot_tokens.get(bot_id) != bot_token:
+                    provider.set_bot_token(bot_id, bot_token)
 
-                    # Use admin token for Researchers
-                    result = provider._make_request(
-                        "POST",
-                        f"/c/{community_slug}/threads",
-                        data={
-                            "title": title,
-                            "content": body
-                        }
-                    )
-                    thread_id = result["id"]
-                    # Get the first post ID (the OP)
-                    posts_result = provider._make_request(
-                        "GET",
-                        f"/t/{thread_id}/posts"
-                    )
-                    post_id = posts_result[0]["id"] if posts_result else None
-
-                    logger.info(f"Created thread: {title[:50]}... by {account_name}")
-
-                    # Store reference for "0" (the thread/OP)
-                    post_refs["0"] = {"thread_id": thread_id, "post_id": post_id}
-
-                    log_post({
-                        "timestamp": datetime.now().isoformat(),
-                        "type": "thread",
-                        "account": account_name,
-                        "thread_id": thread_id,
-                        "post_id": post_id,
-                        "ref": "0"
-                    })
-
-                elif kind == "comment":
-                    # Map account name to bot ID
-                    bot_id = state.get("account_mapping", {}).get(account_name)
-                    if not bot_id:
-                        logger.warning(f"Unknown account: {account_name}, skipping...")
-                        continue
+                # Determine thread_id and parent_post_id from reply_to
+                # reply_to = "0" means reply to thread (no parent)
+                # reply_to = "1" means reply to post referenced by "1"
+                # reply_to = "1.1" means reply to post referenced by "1.1"
 
-                    # Get bot token
-                    bot_token = state.get("bot_tokens", {}).get(bot_id)
-                    if not bot_token:
-                        logger.warning(f"No token for bot {account_name}, skipping...")
+                if reply_to == "0":
+                    # Reply directly to thread (top-level comment)
+                    if "0" not in post_refs:
+                        logger.warning(f"Thread not created yet (ref 0), skipping {account_name}")
+                        continue
+                    thread_id = post_refs["0"]["thread_id"]
+                    parent_post_id = None
+                else:
+                    # Reply to another post
+                    if reply_to not in post_refs:
+                        logger.warning(f"Parent post not found (ref {reply_to}), skipping {account_name}")
                         continue
+                    thread_id = post_refs["0"]["thread_id"]  # Thread is always from ref "0"
+                    parent_post_id = post_refs[reply_to]["post_id"]
+
+                result = provider.submit_reply(
+                    bot_id=bot_id,
+                    thread_id=thread_id,
+                    content=body,
+                    parent_post_id=parent_post_id
+                )
+                post_id = result["postId"]
+                logger.info(f"Created reply by {account_name}")
+
+                # Determine this post's reference ID
+                # We need to find the next available ID in the hierarchy
+                # For top-level (reply_to="0"), find next integer: 1, 2, 3...
+                # For nested (reply_to="1"), find next: 1.1, 1.2...
+                if reply_to == "0":
+                    # Find next top-level ID
+                    existing_top = [k for k in post_refs.keys() if k.isdigit() and k != "0"]
+                    next_id = str(len(existing_top) + 1)
+                else:
+                    # Find next nested ID under reply_to
+                    prefix = reply_to + "."
+                    existing_nested = [k for k in post_refs.keys() if k.startswith(prefix)]
+                    next_num = len(existing_nested) + 1
+                    next_id = f"{reply_to}.{next_num}"
+
+                post_refs[next_id] = {"thread_id": thread_id, "post_id": post_id}
+
+                log_post({
+                    "timestamp": datetime.now().isoformat(),
+                    "type": "comment",
+                    "account": account_name,
+                    "thread_id": thread_id,
+                    "post_id": post_id,
+                    "parent_id": parent_post_id,
+                    "ref": next_id
+                })
+
+            time.sleep(sleep_between)
+
+        except ForumProviderError as e:
+            logger.error(f"Failed to post: {e}")
+            continue
 
-                    provider.set_bot_token(bot_id, bot_token)
+    flush_post_log()
+    logger.info("Schedule run complete!")
 
-                    # Determine thread_id and parent_post_id from reply_to
-                    # reply_to = "0" means reply to thread (no parent)
-                    # reply_to = "1" means reply to post referenced by "1"
-                    # reply_to = "1.1" means reply to post referenced by "1.1"
-
-                    if reply_to == "0":
-                        # Reply directly to thread (top-level comment)
-                        if "0" not in post_refs:
-                            logger.warning(f"Thread not created yet (ref 0), skipping {account_name}")
-                            continue
-                        thread_id = post_refs["0"]["thread_id"]
-                        parent_post_id = None
-                    else:
-                        # Reply to another post
-                        if reply_to not in post_refs:
-                            logger.warning(f"Parent post not found (ref {reply_to}), skipping {account_name}")
-                            continue
-                        thread_id = post_refs["0"]["thread_id"]  # Thread is always from ref "0"
-                        parent_post_id = post_refs[reply_to]["post_id"]
-
-                    result = provider.submit_reply(
-                        bot_id=bot_id,
-                        thread_id=thread_id,
-                        content=body,
-                        parent_post_id=parent_post_id
-                    )
-                    post_id = result["postId"]
-                    logger.info(f"Created reply by {account_name}")
-
-                    # Determine this post's reference ID
-                    # We need to find the next available ID in the hierarchy
-                    # For top-level (reply_to="0"), find next integer: 1, 2, 3...
-                    # For nested (reply_to="1"), find next: 1.1, 1.2...
-                    if reply_to == "0":
-                        # Find next top-level ID
-                        existing_top = [k for k in post_refs.keys() if k.isdigit() and k != "0"]
-                        next_id = str(len(existing_top) + 1)
-                    else:
-                        # Find next nested ID under reply_to
-                        prefix = reply_to + "."
-                        existing_nested = [k for k in post_refs.keys() if k.startswith(prefix)]
-                        next_num = len(existing_nested) + 1
-                        next_id = f"{reply_to}.{next_num}"
-
-                    post_refs[next_id] = {"thread_id": thread_id, "post_id": post_id}
-
-                    log_post({
-                        "timestamp": datetime.now().isoformat(),
-                        "type": "comment",
-                        "account": account_name,
-                        "thread_id": thread_id,
-                        "post_id": post_id,
-                        "parent_id": parent_post_id,
-                        "ref": next_id
-                    })
-
-                time.sleep(sleep_between)
-
-            except ForumProviderError as e:
-                logger.error(f"Failed to post: {e}")
-                continue
 
-    logger.info("Schedule run complete!")
+def _read_schedule_entries(reader) -> List[ScheduleEntry]:
+    """
+    Read schedule rows from a csv.reader positioned at the header line.
+
+    Columns are mapped by header name once, then every row is read by
+    position. Fields are stripped once here so the posting loops can use
+    values as-is. Missing trailing fields become "", columns absent from the
+    header keep the ScheduleEntry default, and unknown columns are ignored.
+    Blank lines are skipped.
+    """
+    header = next(reader, [])
+    column_index = {name: idx for idx, name in enumerate(header)}
+    # (column index or None, default) for each ScheduleEntry field
+    columns = [
+        (column_index.get(field), ScheduleEntry._field_defaults[field])
+        for field in ScheduleEntry._fields
+    ]
+    make_entry = ScheduleEntry._make
+
+    rows = []
+    for values in reader:
+        if not values:
+            continue
+        width = len(values)
+        rows.append(make_entry(
+            default if idx is None else (values[idx].strip() if idx < width else "")
+            for idx, default in columns
+        ))
+    return rows
+
 
+def load_schedule(schedule_file: str) -> Optional[Schedule]:
+    """
+    Load and index a schedule CSV file.
 
-def load_schedule_rows(schedule_file: str) -> List[Dict]:
-    """Load all rows from a schedule CSV file"""
+    Row values are stripped of surrounding whitespace. The parsed schedule
+    is cached and only re-read when the file's modification time changes,
+    so live edits are still picked up.
+    The returned schedule is shared with the cache and must not be modified.
+    """
     schedule_path = SCHEDULES_DIR / schedule_file
-    if not schedule_path.exists():
+    try:
+        mtime_ns = schedule_path.stat().st_mtime_ns
+    except FileNotFoundError:
         logger.error(f"Schedule file not found: {schedule_path}")
-        return []
+        return None
 
-    rows = []
-    with open(schedule_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(row)
-    return rows
+    cached = _schedule_cache.get(schedule_path)
+    if cached and cached.mtime_ns == mtime_ns:
+        return cached
+
+    with open(schedule_path, "r", encoding="utf-8", newline="") as f:
+        rows = _read_schedule_entries(csv.reader(f))
+
+    # Parse each distinct date and time once; many rows share a slot
+    slot_starts: Dict[Tuple[str, str], Optional[datetime]] = {}
+    by_slot: Dict[datetime, List[Tuple[int, ScheduleEntry]]] = defaultdict(list)
+    for idx, row in enumerate(rows):
+        slot_key = (row.datetime, row.time)
+        if slot_key not in slot_starts:
+            try:
+                slot_starts[slot_key] = datetime.strptime(f"{row.datetime} {row.time}", "%Y-%m-%d %H:%M")
+            except ValueError:
+                slot_starts[slot_key] = None
+        when = slot_starts[slot_key]
+        if when is not None:
+            by_slot[when].append((idx, row))
+
+    slot_times = sorted(by_slot)
+
+    schedule = Schedule(mtime_ns=mtime_ns, rows=rows, by_slot=dict(by_slot), slot_times=slot_times)
+    _schedule_cache[schedule_path] = schedule
+    return schedule
+
+
+def load_schedule_rows(schedule_file: str) -> List[ScheduleEntry]:
+    """Load all rows from a schedule CSV file (see load_schedule)"""
+    schedule = load_schedule(schedule_file)
+    return schedule.rows if schedule else []
+
+
+def schedule_changed(schedule_file: str, schedule: Optional[Schedule]) -> bool:
+    """Check whether the schedule file changed since it was loaded (or could not be loaded)"""
+    try:
+        mtime_ns = (SCHEDULES_DIR / schedule_file).stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    return schedule is None or mtime_ns != schedule.mtime_ns
+
+
+def seconds_until_next_check(
+    schedule_file: str,
+    schedule: Optional[Schedule],
+    now: datetime,
+    max_sleep: float
+) -> float:
+    """
+    Get how long watch mode can sleep before its next check.
+
+    Sleeps until the next scheduled slot after the current minute, capped at
+    max_sleep. If the schedule file changed since it was loaded (or could not
+    be loaded), only waits until the next minute so the edit is picked up.
+    """
+    next_minute = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    until_next_minute = (next_minute - now).total_seconds()
+
+    if schedule_changed(schedule_file, schedule):
+        return until_next_minute
+
+    idx = bisect.bisect_left(schedule.slot_times, next_minute)
+    if idx == len(schedule.slot_times):
+        return max_sleep
+    return min(max_sleep, max(until_next_minute, (schedule.slot_times[idx] - now).total_seconds()))
+
+
+def sleep_until_next_check(schedule_file: str, schedule: Optional[Schedule], max_sleep: float) -> None:
+    """
+    Sleep until watch mode's next check (see seconds_until_next_check).
+
+    The sleep is split at minute boundaries and the schedule file's
+    modification time is checked at each one. If the file changed, the
+    sleep ends right away, so posts added by a live edit during a long idle
+    sleep still go out on time. Only the stat is repeated while idle; the
+    schedule itself is re-parsed by the next check.
+    """
+    sleep_seconds = seconds_until_next_check(schedule_file, schedule, datetime.now(), max_sleep)
+    logger.info(f"Sleeping {sleep_seconds:.0f}s until next check...")
+
+    deadline = time.monotonic() + sleep_seconds
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        now = datetime.now()
+        next_minute = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        until_next_minute = (next_minute - now).total_seconds()
+        time.sleep(min(remaining, until_next_minute))
+        if remaining > until_next_minute and schedule_changed(schedule_file, schedule):
+            logger.info("Schedule file changed, checking now")
+            return
+
+
+def post_due_batch(
+    provider: ForumProvider,
+    state: Dict,
+    due_posts: List[Tuple[int, ScheduleEntry, str]],
+    post_refs: Dict[str, Dict[str, str]],
+    default_slug: Optional[str],
+    stop_event: threading.Event,
+    mark_attempted: Callable[[str], None]
+) -> bool:
+    """
+    Execute one batch of due posts in order, with random delays between them.
+
+    mark_attempted is called with each post's key once it has been attempted,
+    whether it was posted, skipped or failed. Stops early (between posts)
+    once stop_event is set; the remaining posts are not marked.
+
+    Returns:
+        True if post_refs was updated
+    """
+    refs_changed = False
+    # Looked up once per batch; the loop below only reads them
+    account_mapping = state.get("account_mapping", {})
+    bot_tokens = state.get("bot_tokens", {})
+    for idx, row, post_key in due_posts:
+        if stop_event.is_set():
+            break
+
+        account_name = row.account
+        title = row.title
+        body = row.body
+        kind = row.kind
+        reply_to = row.reply_to
+        community_slug = row.community
+
+        # Skip empty body
+        if not body:
+            logger.warning(f"Empty body for {account_name}, skipping...")
+            mark_attempted(post_key)
+            continue
+
+        # Use the first community if not specified
+        if not community_slug:
+            community_slug = default_slug
+
+        try:
+            if kind == "self":
+                # Only Researchers can create threads
+                if account_name.lower() != "researchers":
+                    logger.warning(f"Only Researchers can create threads, skipping {account_name}")
+                    continue
+
+                # Use admin token for Researchers
+                result = provider._make_request(
+                    "POST",
+                    f"/c/{community_slug}/threads",
+                    data={
+                        "title": title,
+                        "content": body
+                    }
+                )
+                thread_id = result["id"]
+                # Get the first post ID (the OP)
+                posts_result = provider._make_request(
+                    "GET",
+                    f"/t/{thread_id}/posts"
+                )
+                post_id = posts_result[0]["id"] if posts_result else None
+
+                logger.info(f"Created thread: {title[:50]}... by {account_name}")
+
+                # Store reference for "0" (the thread/OP). Refs from the
+                # previous thread are dropped so replies can't resolve to its
+                # posts and the persisted refs only ever cover one thread.
+                post_refs.clear()
+                post_refs["0"] = {"thread_id": thread_id, "post_id": post_id}
+                refs_changed = True
+
+                log_post({
+                    "timestamp": datetime.now().isoformat(),
+                    "type": "thread",
+                    "account": account_name,
+                    "thread_id": thread_id,
+                    "post_id": post_id,
+                    "ref": "0"
+                })
+
+            elif kind == "comment":
+                # Map account name to bot ID
+                bot_id = account_mapping.get(account_name)
+                if not bot_id:
+                    logger.warning(f"Unknown account: {account_name}, skipping...")
+                    continue
+
+                # Get bot token
+                bot_token = bot_tokens.get(bot_id)
+                if not bot_token:
+                    logger.warning(f"No token for bot {account_name}, skipping...")
+                    continue
+
+                # Only (re)register the token when the provider doesn't hold it yet
+                if provider.bot_tokens.get(bot_id) != bot_token:
+                    provider.set_bot_token(bot_id, bot_token)
+
+                # Determine thread_id and parent_post_id from reply_to
+                if reply_to == "0":
+                    # Reply directly to thread (top-level comment)
+                    if "0" not in post_refs:
+                        logger.warning(f"Thread not created yet (ref 0), skipping {account_name}")
+                        continue
+                    thread_id = post_refs["0"]["thread_id"]
+                    parent_post_id = None
+                else:
+                    # Reply to another post
+                    if reply_to not in post_refs:
+                        logger.warning(f"Parent post not found (ref {reply_to}), skipping {account_name}")
+                        continue
+                    thread_id = post_refs["0"]["thread_id"]
+                    parent_post_id = post_refs[reply_to]["post_id"]
+
+                result = provider.submit_reply(
+                    bot_id=bot_id,
+                    thread_id=thread_id,
+                    content=body,
+                    parent_post_id=parent_post_id
+                )
+                post_id = result["postId"]
+                logger.info(f"Created reply by {account_name}")
+
+                # Determine this post's reference ID
+                if reply_to == "0":
+                    existing_top = [k for k in post_refs.keys() if k.isdigit() and k != "0"]
+                    next_id = str(len(existing_top) + 1)
+                else:
+                    prefix = reply_to + "."
+                    existing_nested = [k for k in post_refs.keys() if k.startswith(prefix)]
+                    next_num = len(existing_nested) + 1
+                    next_id = f"{reply_to}.{next_num}"
+
+                post_refs[next_id] = {"thread_id": thread_id, "post_id": post_id}
+                refs_changed = True
+
+                log_post({
+                    "timestamp": datetime.now().isoformat(),
+                    "type": "comment",
+                    "account": account_name,
+                    "thread_id": thread_id,
+                    "post_id": post_id,
+                    "parent_id": parent_post_id,
+                    "ref": next_id
+                })
+
+        except ForumProviderError as e:
+            logger.error(f"Failed to post: {e}")
+            continue
+
+        finally:
+            # Runs for skipped and failed posts too (continue passes through it)
+            mark_attempted(post_key)
+
+        # Random delay 2-7 seconds between posts
+        if len(due_posts) > 1:
+            delay = random.uniform(2, 7)
+            logger.info(f"Waiting {delay:.1f}s before next post...")
+            stop_event.wait(delay)
+
+    flush_post_log()
+    return refs_changed
+
+
+def _post_worker(
+    provider: ForumProvider,
+    state: Dict,
+    jobs: "queue.Queue[Optional[List[Tuple[int, ScheduleEntry, str]]]]",
+    post_refs: Dict[str, Dict[str, str]],
+    default_slug: Optional[str],
+    stop_event: threading.Event,
+    mark_attempted: Callable[[str], None]
+) -> None:
+    """
+    Background posting thread for watch mode.
+
+    Drains batches of due posts from the queue one at a time, so posts keep
+    their order (threads before replies) while the scheduler keeps its
+    timing. A None job stops the worker.
+    """
+    while not stop_event.is_set():
+        due_posts = jobs.get()
+        if due_posts is None:
+            break
+        try:
+            if post_due_batch(provider, state, due_posts, post_refs, default_slug, stop_event, mark_attempted):
+                # post_refs lives inside state, so this persists reply targets
+                save_state(state)
+        except Exception:
+            logger.exception("Posting batch failed")
 
 
 def run_watch(provider: ForumProvider, config: Dict, schedule_file: str) -> None:
     """
     Watch mode: continuously check for scheduled posts and execute them.
 
-    Runs every minute, checks for posts due at the current time,
-    executes them in order (Researchers first, then bots) with random delays.
+    Wakes up for each scheduled minute (or at least every
+    max_idle_sleep_seconds, and within a minute of any edit to the schedule
+    file), checks for posts due at the current time and hands them to a
+    background thread, which executes them in order
+    (Researchers first, then bots) with random delays.
 
     Key behavior:
     - "Researchers" account creates threads using admin token
@@ -378,196 +906,102 @@ def run_watch(provider: ForumProvider, config: Dict, schedule_file: str) -> None
         logger.error("No bots found. Run --init-forum first.")
         return
 
-    # Track which posts have been executed (by row index + date/time)
-    executed_posts = set()
-
-    # Track created posts for reply_to references (persists across minutes)
+    max_idle_sleep = config.get("max_idle_sleep_seconds", 3600)
+    default_slug = get_default_community_slug(state)
+
+    # Track which posts have been executed (by row index + date/time),
+    # including those from earlier runs so a restart doesn't repost them.
+    # A post is only recorded once the posting thread has attempted it;
+    # until then its key is in queued_posts (in memory only) so the
+    # scheduler doesn't hand it over twice.
+    executed_posts = load_executed_posts()
+    queued_posts: Set[str] = set()
+    executed_lock = threading.Lock()
+    session_posts = 0
+
+    def mark_attempted(post_key: str) -> None:
+        nonlocal session_posts
+        with executed_lock:
+            executed_posts.add(post_key)
+            queued_posts.discard(post_key)
+            session_posts += 1
+        mark_executed([post_key])
+    last_date = date.today().isoformat()
+
+    # Track created posts for reply_to references (persists across minutes and
+    # restarts as part of the state file); reset whenever a new thread is created
     # Key format: "0" for thread, "1", "2" for top-level replies, "1.1" for nested
-    post_refs: Dict[str, Dict[str, str]] = {}
+    # Only the posting thread reads or updates it.
+    post_refs: Dict[str, Dict[str, str]] = state.setdefault("post_refs", {})
+
+    # Due posts are executed by a background thread so that slow API calls
+    # and the delays between posts never hold up the scheduler
+    jobs: "queue.Queue[Optional[List[Tuple[int, ScheduleEntry, str]]]]" = queue.Queue()
+    stop_event = threading.Event()
+    worker = threading.Thread(
+        target=_post_worker,
+        args=(provider, state, jobs, post_refs, default_slug, stop_event, mark_attempted),
+        name="post-worker",
+        daemon=True
+    )
+    worker.start()
 
     try:
         while True:
             now = datetime.now()
+            current_slot = now.replace(second=0, microsecond=0)
             current_date = now.strftime("%Y-%m-%d")
             current_time = now.strftime("%H:%M")
 
             logger.info(f"[{current_date} {current_time}] Checking for scheduled posts...")
 
-            # Load schedule fresh each time (allows live updates)
-            rows = load_schedule_rows(schedule_file)
+            # Forget old executed posts once a day
+            if current_date != last_date:
+                with executed_lock:
+                    prune_executed_posts(executed_posts)
+                last_date = current_date
 
-            # Find posts due now
-            due_posts = []
-            for idx, row in enumerate(rows):
-                row_date = row.get("datetime", "").strip()
-                row_time = row.get("time", "").strip()
+            # Reload the schedule if it changed (allows live updates)
+            schedule = load_schedule(schedule_file)
+            slot_rows = schedule.by_slot.get(current_slot, []) if schedule else []
 
-                # Check if this post is due now and hasn't been executed
-                post_key = f"{idx}:{row_date}:{row_time}"
-                if row_date == current_date and row_time == current_time and post_key not in executed_posts:
-                    due_posts.append((idx, row, post_key))
+            # Find posts due now that haven't been executed
+            due_posts = []
+            with executed_lock:
+                for idx, row in slot_rows:
+                    post_key = f"{idx}:{current_date}:{current_time}"
+                    if post_key not in executed_posts and post_key not in queued_posts:
+                        due_posts.append((idx, row, post_key))
+                queued_posts.update(post_key for _, _, post_key in due_posts)
 
             if due_posts:
                 logger.info(f"Found {len(due_posts)} posts to execute")
 
                 # Sort so "self" posts come first (thread creation before replies)
                 # Then randomize the remaining comments
-                self_posts = [(i, r, k) for i, r, k in due_posts if r.get("kind", "").strip() == "self"]
-                comment_posts = [(i, r, k) for i, r, k in due_posts if r.get("kind", "").strip() != "self"]
+                self_posts = [(i, r, k) for i, r, k in due_posts if r.kind == "self"]
+                comment_posts = [(i, r, k) for i, r, k in due_posts if r.kind != "self"]
                 random.shuffle(comment_posts)
                 due_posts = self_posts + comment_posts
 
-                for idx, row, post_key in due_posts:
-                    account_name = row.get("account", "").strip()
-                    title = row.get("title", "").strip()
-                    body = row.get("body", "").strip()
-                    kind = row.get("kind", "self").strip()
-                    reply_to = row.get("reply_to", "").strip()
-                    community_slug = row.get("community", "").strip()
-
-                    # Skip empty body
-                    if not body:
-                        logger.warning(f"Empty body for {account_name}, skipping...")
-                        executed_posts.add(post_key)
-                        continue
-
-                    # Get community slug from first community if not specified
-                    if not community_slug:
-                        communities = state.get("communities", {})
-                        if communities:
-                            first_community = list(communities.values())[0]
-                            community_slug = first_community.get("slug")
-
-                    try:
-                        if kind == "self":
-                            # Only Researchers can create threads
-                            if account_name.lower() != "researchers":
-                                logger.warning(f"Only Researchers can create threads, skipping {account_name}")
-                                executed_posts.add(post_key)
-                                continue
-
-                            # Use admin token for Researchers
-                            result = provider._make_request(
-                                "POST",
-                                f"/c/{community_slug}/threads",
-                                data={
-                                    "title": title,
-                                    "content": body
-                                }
-                            )
-                            thread_id = result["id"]
-                            # Get the first post ID (the OP)
-                            posts_result = provider._make_request(
-                                "GET",
-                                f"/t/{thread_id}/posts"
-                            )
-                            post_id = posts_result[0]["id"] if posts_result else None
-
-                            logger.info(f"Created thread: {title[:50]}... by {account_name}")
-
-                            # Store reference for "0" (the thread/OP)
-                            post_refs["0"] = {"thread_id": thread_id, "post_id": post_id}
-
-                            log_post({
-                                "timestamp": datetime.now().isoformat(),
-                                "type": "thread",
-                                "account": account_name,
-                                "thread_id": thread_id,
-                                "post_id": post_id,
-                                "ref": "0"
-                            })
-
-                        elif kind == "comment":
-                            # Map account name to bot ID
-                            bot_id = state.get("account_mapping", {}).get(account_name)
-                            if not bot_id:
-                                logger.warning(f"Unknown account: {account_name}, skipping...")
-                                executed_posts.add(post_key)
-                                continue
-
-                            # Get bot token
-                            bot_token = state.get("bot_tokens", {}).get(bot_id)
-                            if not bot_token:
-                                logger.warning(f"No token for bot {account_name}, skipping...")
-                                executed_posts.add(post_key)
-                                continue
-
-                            provider.set_bot_token(bot_id, bot_token)
-
-                            # Determine thread_id and parent_post_id from reply_to
-                            if reply_to == "0":
-                                # Reply directly to thread (top-level comment)
-                                if "0" not in post_refs:
-                                    logger.warning(f"Thread not created yet (ref 0), skipping {account_name}")
-                                    executed_posts.add(post_key)
-                                    continue
-                                thread_id = post_refs["0"]["thread_id"]
-                                parent_post_id = None
-                            else:
-                                # Reply to another post
-                                if reply_to not in post_refs:
-                                    logger.warning(f"Parent post not found (ref {reply_to}), skipping {account_name}")
-                                    executed_posts.add(post_key)
-                                    continue
-                                thread_id = post_refs["0"]["thread_id"]
-                                parent_post_id = post_refs[reply_to]["post_id"]
-
-                            result = provider.submit_reply(
-                                bot_id=bot_id,
-                                thread_id=thread_id,
-                                content=body,
-                                parent_post_id=parent_post_id
-                            )
-                            post_id = result["postId"]
-                            logger.info(f"Created reply by {account_name}")
-
-                            # Determine this post's reference ID
-                            if reply_to == "0":
-                                existing_top = [k for k in post_refs.keys() if k.isdigit() and k != "0"]
-                                next_id = str(len(existing_top) + 1)
-                            else:
-                                prefix = reply_to + "."
-                                existing_nested = [k for k in post_refs.keys() if k.startswith(prefix)]
-                                next_num = len(existing_nested) + 1
-                                next_id = f"{reply_to}.{next_num}"
-
-                            post_refs[next_id] = {"thread_id": thread_id, "post_id": post_id}
-
-                            log_post({
-                                "timestamp": datetime.now().isoformat(),
-                                "type": "comment",
-                                "account": account_name,
-                                "thread_id": thread_id,
-                                "post_id": post_id,
-                                "parent_id": parent_post_id,
-                                "ref": next_id
-                            })
-
-                        executed_posts.add(post_key)
-
-                        # Random delay 2-7 seconds between posts
-                        if len(due_posts) > 1:
-                            delay = random.uniform(2, 7)
-                            logger.info(f"Waiting {delay:.1f}s before next post...")
-                            time.sleep(delay)
-
-                    except ForumProviderError as e:
-                        logger.error(f"Failed to post: {e}")
-                        executed_posts.add(post_key)
-                        continue
+                # Hand the batch to the posting thread, which records each
+                # post as executed once it has been attempted
+                jobs.put(due_posts)
 
             else:
                 logger.info("No posts due at this time")
 
-            # Wait until the next minute
-            now = datetime.now()
-            seconds_until_next_minute = 60 - now.second
-            logger.info(f"Sleeping {seconds_until_next_minute}s until next check...")
-            time.sleep(seconds_until_next_minute)
+            # Wait until the next scheduled post or schedule edit
+            sleep_until_next_check(schedule_file, schedule, max_idle_sleep)
 
     except KeyboardInterrupt:
         logger.info("\nWatch mode stopped by user")
-        logger.info(f"Total posts executed this session: {len(executed_posts)}")
+        # Let the posting thread finish its current request, then stop
+        stop_event.set()
+        jobs.put(None)
+        worker.join()
+        # Only posts the worker attempted count; batches still queued are dropped
+        logger.info(f"Total posts executed this session: {session_posts}")
 
 
 def show_status() -> None:
@@ -590,12 +1024,9 @@ def show_status() -> None:
     print(f"\nBots: {len(bots)}")
 
     # Group by community
-    by_community: Dict[str, List] = {}
-    for key, bot in bots.items():
-        comm_slug = bot.get("community_slug", "unknown")
-        if comm_slug not in by_community:
-            by_community[comm_slug] = []
-        by_community[comm_slug].append(bot["display_name"])
+    by_community: Dict[str, List] = defaultdict(list)
+    for bot in bots.values():
+        by_community[bot.get("community_slug", "unknown")].append(bot["display_name"])
 
     for comm_slug, bot_names in by_community.items():
         print(f"  {comm_slug}: {len(bot_names)} bots")
@@ -607,9 +1038,10 @@ def show_status() -> None:
     # Check for posted log
     log_path = STATE_DIR / "posted_log.jsonl"
     if log_path.exists():
-        with open(log_path, "r") as f:
-            posts = [json.loads(line) for line in f if line.strip()]
-        print(f"\nPosted: {len(posts)} entries")
+        # Binary mode: the log is UTF-8 whatever the locale, and lines are only counted
+        with open(log_path, "rb") as f:
+            post_count = sum(1 for line in f if line.strip())
+        print(f"\nPosted: {post_count} entries")
 
 
 def main():